@@ -1,4 +1,6 @@
-# klayout/print_drc_summary.rb
+# klayout/print_drc_report.rb
+# Standalone summary of a DRC report (run_drc prints the same summary in Python):
+#   REPORT=build/reports/drc_report.lyrdb klayout -b -r klayout/print_drc_report.rb
 include RBA
 
 report_path = (ENV["REPORT"] || "").strip
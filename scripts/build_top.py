@@ -1,11 +1,9 @@
 from __future__ import annotations
 from pathlib import Path
-import gdsfactory as gf
 from pic_template.chips.top import top
 from pic_template.config import get_config
 
-# Activate the generic PDK (required before creating components)
-gf.gpdk.PDK.activate()
+# The generic PDK is activated once when pic_template is imported
 
 def main() -> None:
     config = get_config()
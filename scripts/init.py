@@ -10,12 +10,29 @@ Usage:
 """
 
 from __future__ import annotations
+import functools
+import os
 import re
 import shutil
+import stat
 import subprocess
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
+# Must start with letter or underscore, contain only alphanumerics and underscores
+_NAME_RE = re.compile(r"[A-Za-z_][A-Za-z0-9_]*\Z")
+
+# Directory names that are never descended into when collecting files
+EXCLUDE_DIRS = frozenset({".git", "__pycache__", ".pytest_cache", "build", ".venv", ".ruff_cache"})
+
+# Text files likely to contain references to the template name
+SUFFIXES = frozenset({
+    ".py", ".toml", ".yaml", ".yml", ".md", ".txt",
+    ".sh", ".makefile", "", ".json", ".lock",
+})
+NAMES = frozenset({"Makefile", "pyproject.toml", "README.md"})
+
 
 def validate_project_name(name: str) -> bool:
     """Validate that project name is a valid Python package name.
@@ -30,9 +47,7 @@ def validate_project_name(name: str) -> bool:
     bool
         True if valid Python package name
     """
-    # Must start with letter or underscore, contain only alphanumerics and underscores
-    pattern = r'^[a-zA-Z_][a-zA-Z0-9_]*$'
-    return bool(re.match(pattern, name))
+    return _NAME_RE.match(name) is not None
 
 
 def get_project_name() -> str:
@@ -80,80 +95,194 @@ def get_project_name() -> str:
         print("Please try again.\n")
 
 
-def find_files_to_update() -> list[Path]:
-    """Find all files that need updating (exclude .git, __pycache__, build).
+def _is_candidate(name: str) -> bool:
+    """Return True if a file name looks like text that may reference the template."""
+    # Same rule as Path.suffix, without building a Path per entry
+    dot = name.rfind(".")
+    suffix = name[dot:] if 0 < dot < len(name) - 1 else ""
+
+    # Binary files (.pyc, .gds, .lyrdb) never match these
+    return suffix in SUFFIXES or name in NAMES
+
+
+def _git_files(root: Path) -> list[Path] | None:
+    """List tracked and untracked-but-not-ignored files via git.
+    
+    Parameters
+    ----------
+    root : Path
+        Repository root
     
     Returns
     -------
-    list[Path]
-        List of file paths to update
+    list[Path] | None
+        Candidate files, or None if git is unavailable or root is not a repo
     """
-    root = Path.cwd()
-    exclude_dirs = {".git", "__pycache__", ".pytest_cache", "build", ".venv", ".ruff_cache"}
-    
+    if not (root / ".git").exists():
+        return None
+
+    try:
+        out = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=root, check=True, capture_output=True,
+        ).stdout
+    except (FileNotFoundError, subprocess.CalledProcessError):
+        return None
+
     files = []
-    for file_path in root.rglob("*"):
-        # Skip excluded directories
-        if any(excl in file_path.parts for excl in exclude_dirs):
+    for raw in out.split(b"\0"):
+        if not raw:
             continue
-        
-        # Only process files (not directories)
-        if not file_path.is_file():
+        # Untracked nested repos are listed as "dir/", submodules as a bare path
+        is_dir_entry = raw.endswith(b"/")
+        rel = os.fsdecode(raw).rstrip("/")
+        parts = rel.split("/")
+        if not EXCLUDE_DIRS.isdisjoint(parts[:-1]):
             continue
-        
-        # Skip binary files
-        if file_path.suffix in {".pyc", ".gds", ".lyrdb"}:
+        if not (is_dir_entry or _is_candidate(parts[-1])):
             continue
-        
-        # Include text files likely to contain references
-        if file_path.suffix in {
-            ".py", ".toml", ".yaml", ".yml", ".md", ".txt", 
-            ".sh", ".makefile", "", ".json", ".lock"
-        } or file_path.name in {"Makefile", "pyproject.toml", "README.md"}:
-            files.append(file_path)
+
+        path = root / rel
+        try:
+            mode = path.lstat().st_mode
+        except OSError:  # tracked but deleted from the worktree
+            continue
+
+        # Same rules as _walk_files: descend into directories git does not
+        # recurse into, and skip symlinks and special files
+        if stat.S_ISDIR(mode):
+            if parts[-1] not in EXCLUDE_DIRS:
+                files.extend(_walk_files(path))
+        elif stat.S_ISREG(mode):
+            files.append(path)
+
+    # --cached may list the same path twice during merges
+    return list(dict.fromkeys(files))
+
+
+def _walk_files(root: Path) -> list[Path]:
+    """List candidate files by walking the tree, pruning excluded directories.
+    
+    Parameters
+    ----------
+    root : Path
+        Directory to walk
+    
+    Returns
+    -------
+    list[Path]
+        Candidate files
+    """
+    files = []
+    stack = [str(root)]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                # Prune excluded directories before descending into them
+                if entry.is_dir(follow_symlinks=False):
+                    if entry.name not in EXCLUDE_DIRS:
+                        stack.append(entry.path)
+                    continue
+
+                # Only process files (not symlinks or special files)
+                if entry.is_file(follow_symlinks=False) and _is_candidate(entry.name):
+                    files.append(Path(entry.path))
     
     return files
 
 
-def replace_in_file(file_path: Path, old_name: str, new_name: str) -> bool:
-    """Replace old project name with new name in a file.
+def find_files_to_update() -> list[Path]:
+    """Find all files that need updating (exclude .git, __pycache__, build).
+    
+    Uses git's index when the project is a git checkout, and falls back to
+    walking the directory tree otherwise.
+    
+    Returns
+    -------
+    list[Path]
+        List of file paths to update
+    """
+    root = Path.cwd()
+    files = _git_files(root)
+    if files is None:
+        files = _walk_files(root)
+    return files
+
+
+def name_variants(old_name: str, new_name: str) -> tuple[tuple[str, str], ...]:
+    """Build the (old, new) pairs for every spelling of the project name.
     
     Parameters
     ----------
-    file_path : Path
-        File to update
     old_name : str
         Old project name (pic_template)
     new_name : str
         New project name
     
+    Returns
+    -------
+    tuple[tuple[str, str], ...]
+        Replacement pairs for snake_case, kebab-case and UPPERCASE spellings
+    """
+    return (
+        # pic_template (snake_case)
+        (old_name, new_name),
+        # pic-template (kebab-case)
+        (old_name.replace("_", "-"), new_name.replace("_", "-")),
+        # PIC_TEMPLATE (uppercase)
+        (old_name.upper(), new_name.upper()),
+    )
+
+
+@functools.lru_cache(maxsize=None)
+def _build_substitution(
+    replacements: tuple[tuple[str, str], ...],
+) -> tuple[dict[str, str], re.Pattern, tuple[bytes, ...]]:
+    """Build the lookup dict, matching regex and byte needles once per run."""
+    mapping = dict(replacements)
+    pattern = re.compile("|".join(re.escape(old) for old in mapping))
+    needles = tuple(old.encode("utf-8") for old in mapping)
+    return mapping, pattern, needles
+
+
+def replace_in_file(file_path: Path, replacements: tuple[tuple[str, str], ...]) -> bool:
+    """Replace old project name with new name in a file.
+    
+    Parameters
+    ----------
+    file_path : Path
+        File to update
+    replacements : tuple[tuple[str, str], ...]
+        (old, new) pairs, as built by name_variants()
+    
     Returns
     -------
     bool
         True if file was modified
     """
+    mapping, pattern, needles = _build_substitution(replacements)
+
     try:
-        content = file_path.read_text(encoding="utf-8")
-    except (UnicodeDecodeError, FileNotFoundError):
+        data = file_path.read_bytes()
+    except OSError:  # vanished, a directory, or unreadable
+        return False
+
+    # Cheap byte scan first: most files never mention the template name,
+    # so skip decoding and rewriting them entirely
+    if not any(needle in data for needle in needles):
+        return False
+
+    try:
+        content = data.decode("utf-8")
+    except UnicodeDecodeError:
         return False
     
-    original_content = content
-    
-    # Replace pic_template (snake_case)
-    content = content.replace(old_name, new_name)
-    
-    # Replace pic-template (kebab-case) → converted to snake_case with underscores
-    kebab_old = old_name.replace("_", "-")
-    kebab_new = new_name.replace("_", "-")
-    content = content.replace(kebab_old, kebab_new)
-    
-    # Replace PIC_TEMPLATE (uppercase) if relevant
-    content = content.replace(old_name.upper(), new_name.upper())
-    
-    if content == original_content:
+    # Replace all name variants in a single pass
+    content, count = pattern.subn(lambda m: mapping[m.group(0)], content)
+    if count == 0:
         return False
     
-    file_path.write_text(content, encoding="utf-8")
+    file_path.write_bytes(content.encode("utf-8"))
     return True
 
 
@@ -185,12 +314,14 @@ def reinit_git() -> None:
     
     # Initialize new repo
     subprocess.run(["git", "init"], check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.email", "you@example.com"], check=True, capture_output=True)
-    subprocess.run(["git", "config", "user.name", "Your Name"], check=True, capture_output=True)
     
-    # Create initial commit
+    # Create initial commit; identity is passed per-command instead of via git config
     subprocess.run(["git", "add", "."], check=True, capture_output=True)
-    subprocess.run(["git", "commit", "-m", "Initial commit"], check=True, capture_output=True)
+    subprocess.run(
+        ["git", "-c", "user.email=you@example.com", "-c", "user.name=Your Name",
+         "commit", "-m", "Initial commit"],
+        check=True, capture_output=True,
+    )
     print("✓ Initialized new git repository")
 
 
@@ -211,12 +342,11 @@ def main():
     print("Starting initialization...\n")
     
     # Find and update files
+    # Work is I/O bound, so a thread pool overlaps the file reads and writes
     files_to_update = find_files_to_update()
-    updated_count = 0
-    
-    for file_path in files_to_update:
-        if replace_in_file(file_path, old_name, new_name):
-            updated_count += 1
+    replace = functools.partial(replace_in_file, replacements=name_variants(old_name, new_name))
+    with ThreadPoolExecutor(max_workers=min(32, (os.cpu_count() or 1) * 4)) as executor:
+        updated_count = sum(executor.map(replace, files_to_update))
     
     print(f"✓ Updated {updated_count} files")
     
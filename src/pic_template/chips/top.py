@@ -23,6 +23,7 @@ def top() -> gf.Component:
     
     # Add label
     label = c << gf.components.text("PIC TEMPLATE v2", size=20, layer=LAYER.TEXT)
-    label.move((c.xmin, c.ymax + 50))
+    bbox = c.bbox()  # one hierarchy walk instead of one per xmin/ymax query
+    label.move((bbox.left, bbox.top + 50))
 
     return c
@@ -16,6 +16,7 @@ import gdsfactory as gf
 from gdsfactory.typings import ComponentSpec
 from pic_template.components.straight import straight_waveguide
 from pic_template.pdk.cross_section import xs_strip
+from pic_template.utils.ports import port_name
 
 
 @gf.cell
@@ -56,17 +57,17 @@ def waveguide_array(
     """
     c = gf.Component(f"waveguide_array_{n_channels}ch")
     
-    # Create and place waveguides
+    # Build the waveguide once and place N references to it
+    wg = straight_waveguide(length=length, xs=cross_section)
     for i in range(n_channels):
-        wg = straight_waveguide(length=length, xs=cross_section)
         ref = c << wg
         
         # Place at y-offset
         ref.movey(i * spacing)
         
         # Add input/output ports with channel numbering
-        c.add_port(f"in_{i}", port=ref.ports["o1"])
-        c.add_port(f"out_{i}", port=ref.ports["o2"])
+        c.add_port(port_name("in_{}", i), port=ref.ports["o1"])
+        c.add_port(port_name("out_{}", i), port=ref.ports["o2"])
     
     return c
 
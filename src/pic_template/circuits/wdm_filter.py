@@ -13,8 +13,10 @@ This circuit shows:
 
 from __future__ import annotations
 import gdsfactory as gf
+import numpy as np
 from pic_template.components.rings import ring_racetrack
 from pic_template.pdk.cross_section import xs_strip
+from pic_template.utils.ports import port_name
 
 
 @gf.cell
@@ -65,7 +67,7 @@ def wdm_filter(
     """
     if coupling_gaps is None:
         # Create linearly spaced coupling gaps from 0.1 to 0.5 µm
-        coupling_gaps = [0.1 + (0.4 * i / (n_channels - 1)) for i in range(n_channels)]
+        coupling_gaps = np.linspace(0.1, 0.5, n_channels).tolist()
     
     assert len(coupling_gaps) == n_channels, "coupling_gaps must match n_channels"
     
@@ -88,8 +90,8 @@ def wdm_filter(
         # Add bus ports with channel naming
         # Note: In this simplified design, we expose bus ports only
         # Real WDM would connect rings in cascade with routing
-        c.add_port(f"ch{i}_in", port=ref.ports["bus_o1"])
-        c.add_port(f"ch{i}_out", port=ref.ports["bus_o2"])
+        c.add_port(port_name("ch{}_in", i), port=ref.ports["bus_o1"])
+        c.add_port(port_name("ch{}_out", i), port=ref.ports["bus_o2"])
     
     return c
 
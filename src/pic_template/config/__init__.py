@@ -4,9 +4,24 @@ Load configuration from YAML file to make it easy to switch between
 different projects or foundries.
 """
 
+from functools import lru_cache
 from pathlib import Path
 import yaml
 
+# Use the libyaml-backed loader when available (much faster to parse)
+_YamlLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _substitute(obj, old: str, new: str):
+    """Recursively replace a template variable in all strings of a config tree."""
+    if isinstance(obj, dict):
+        return {_substitute(k, old, new): _substitute(v, old, new) for k, v in obj.items()}
+    if isinstance(obj, list):
+        return [_substitute(v, old, new) for v in obj]
+    if isinstance(obj, str) and old in obj:
+        return obj.replace(old, new)
+    return obj
+
 
 def load_config(config_file: Path = None) -> dict:
     """Load configuration from YAML file.
@@ -33,17 +48,25 @@ def load_config(config_file: Path = None) -> dict:
         raise FileNotFoundError(f"Config file not found: {config_file}")
     
     with open(config_file) as f:
-        config = yaml.safe_load(f)
+        config = yaml.load(f, Loader=_YamlLoader)
     
     # Process template variables (e.g., {project.name})
     project_name = config.get("project", {}).get("name", "pic_template")
-    config_str = yaml.dump(config)
-    config_str = config_str.replace("{project.name}", project_name)
-    config = yaml.safe_load(config_str)
+    config = _substitute(config, "{project.name}", project_name)
     
     return config
 
 
+@lru_cache(maxsize=1)
 def get_config() -> dict:
-    """Get default configuration."""
+    """Get default configuration.
+    
+    The default config file is parsed once per process and the same dict
+    is returned on every call, so treat it as read-only.
+    """
     return load_config()
+
+
+def invalidate_config_cache() -> None:
+    """Force the next get_config() call to re-read the config file."""
+    get_config.cache_clear()
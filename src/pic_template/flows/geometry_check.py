@@ -6,11 +6,21 @@ the KLayout DRC. These checks can be run as part of the test suite.
 
 from __future__ import annotations
 from typing import Any
+import warnings
 import gdsfactory as gf
+import numpy as np
+
+# Manhattan port orientations accepted by default
+_DEFAULT_ANGLES = frozenset((0, 90, 180, 270))
 
 
 class GeometryChecker:
-    """Verify component geometry constraints programmatically."""
+    """Verify component geometry constraints programmatically.
+    
+    The component's ports and bounding box are snapshotted on construction,
+    so every check reads the same flat data instead of re-querying the
+    (possibly deep) component hierarchy.
+    """
     
     def __init__(self, component: gf.Component):
         """Initialize checker with a component.
@@ -20,8 +30,69 @@ class GeometryChecker:
         component : gf.Component
             Component to verify
         """
-        self.component = component
         self.violations = []
+        self._snapshot(component)
+    
+    def _snapshot(self, component: gf.Component) -> None:
+        """Store the component with its ports, port arrays and bounding box."""
+        self._component = component
+        self._ports = tuple(component.ports)
+        self._port_widths = np.fromiter(
+            (p.width for p in self._ports), dtype=np.float64, count=len(self._ports)
+        )
+        self._port_orientations = np.fromiter(
+            (p.orientation for p in self._ports), dtype=np.float64, count=len(self._ports)
+        )
+        self._bbox = component.bbox()
+    
+    @property
+    def component(self) -> gf.Component:
+        """Component being verified."""
+        return self._component
+    
+    @component.setter
+    def component(self, component: gf.Component) -> None:
+        warnings.warn(
+            "Replacing GeometryChecker.component re-snapshots its geometry; "
+            "create a new GeometryChecker instead",
+            stacklevel=2,
+        )
+        self._snapshot(component)
+    
+    def _scan_ports(self, width_range: tuple[float, float] | None,
+                    allowed_angles: frozenset[float] | None) -> tuple[list[str], list[str]]:
+        """Collect port width and orientation violations.
+        
+        Bounds are tested on the snapshotted width/orientation arrays, so only
+        offending ports are visited in Python. Either check is skipped when its
+        constraint is None.
+        """
+        width_violations = []
+        orientation_violations = []
+        
+        if width_range is not None:
+            min_width, max_width = width_range
+            widths = self._port_widths
+            for i in np.flatnonzero((widths < min_width) | (widths > max_width)):
+                port = self._ports[i]
+                if port.width < min_width:
+                    width_violations.append(
+                        f"Port {port.name} width {port.width:.3f} < {min_width} µm"
+                    )
+                else:
+                    width_violations.append(
+                        f"Port {port.name} width {port.width:.3f} > {max_width} µm"
+                    )
+        
+        if allowed_angles is not None:
+            invalid = ~np.isin(self._port_orientations, list(allowed_angles))
+            for i in np.flatnonzero(invalid):
+                port = self._ports[i]
+                orientation_violations.append(
+                    f"Port {port.name} has invalid orientation {port.orientation}°"
+                )
+        
+        return width_violations, orientation_violations
     
     def check_min_feature_size(self, min_width: float = 0.45) -> bool:
         """Check minimum feature size in the component.
@@ -38,7 +109,7 @@ class GeometryChecker:
         """
         # This is a simplified check - full implementation would analyze
         # the actual polygon geometry
-        bbox = self.component.bbox()
+        bbox = self._bbox
         if bbox.width() < min_width or bbox.height() < min_width:
             self.violations.append(
                 f"Component has dimension < {min_width} µm"
@@ -62,7 +133,7 @@ class GeometryChecker:
         bool
             True if port count matches expectation
         """
-        actual_count = len(self.component.ports)
+        actual_count = len(self._ports)
         
         if expected_count is not None:
             if actual_count != expected_count:
@@ -91,21 +162,9 @@ class GeometryChecker:
         bool
             True if all port widths are within range
         """
-        all_valid = True
-        
-        for port in self.component.ports:
-            if port.width < min_width:
-                self.violations.append(
-                    f"Port {port.name} width {port.width:.3f} < {min_width} µm"
-                )
-                all_valid = False
-            elif port.width > max_width:
-                self.violations.append(
-                    f"Port {port.name} width {port.width:.3f} > {max_width} µm"
-                )
-                all_valid = False
-        
-        return all_valid
+        width_violations, _ = self._scan_ports((min_width, max_width), None)
+        self.violations.extend(width_violations)
+        return not width_violations
     
     def check_bounding_box(self, max_width: float | None = None, 
                           max_height: float | None = None) -> bool:
@@ -123,7 +182,7 @@ class GeometryChecker:
         bool
             True if bounding box is within constraints
         """
-        bbox = self.component.bbox()
+        bbox = self._bbox
         width = bbox.width()
         height = bbox.height()
         all_valid = True
@@ -155,19 +214,40 @@ class GeometryChecker:
         bool
             True if all port orientations are valid
         """
-        if allowed_angles is None:
-            allowed_angles = [0, 90, 180, 270]
+        allowed_angles = _DEFAULT_ANGLES if allowed_angles is None else frozenset(allowed_angles)
         
-        all_valid = True
+        _, orientation_violations = self._scan_ports(None, allowed_angles)
+        self.violations.extend(orientation_violations)
+        return not orientation_violations
+    
+    def check_ports(self, min_width: float = 0.4, max_width: float = 2.0,
+                    allowed_angles: list[float] | None = None) -> tuple[bool, bool]:
+        """Check port widths and orientations in a single pass over the ports.
         
-        for port in self.component.ports:
-            if port.orientation not in allowed_angles:
-                self.violations.append(
-                    f"Port {port.name} has invalid orientation {port.orientation}°"
-                )
-                all_valid = False
+        Equivalent to calling check_port_widths() then check_port_orientations().
         
-        return all_valid
+        Parameters
+        ----------
+        min_width : float
+            Minimum port width in micrometers
+        max_width : float
+            Maximum port width in micrometers
+        allowed_angles : list[float] | None
+            Allowed port angles, defaults to [0, 90, 180, 270]
+        
+        Returns
+        -------
+        tuple[bool, bool]
+            (widths valid, orientations valid)
+        """
+        allowed_angles = _DEFAULT_ANGLES if allowed_angles is None else frozenset(allowed_angles)
+        
+        width_violations, orientation_violations = self._scan_ports(
+            (min_width, max_width), allowed_angles
+        )
+        self.violations.extend(width_violations)
+        self.violations.extend(orientation_violations)
+        return not width_violations, not orientation_violations
     
     def run_all_checks(self, is_top_level: bool = False) -> dict[str, Any]:
         """Run all geometry checks.
@@ -184,13 +264,17 @@ class GeometryChecker:
         """
         self.violations = []
         
+        min_feature_size = self.check_min_feature_size()
+        port_count = self.check_port_count(allow_zero=is_top_level)
+        port_widths, port_orientations = self.check_ports()
+        
         results = {
             "component_name": self.component.name,
             "checks": {
-                "min_feature_size": self.check_min_feature_size(),
-                "port_count": self.check_port_count(allow_zero=is_top_level),
-                "port_widths": self.check_port_widths(),
-                "port_orientations": self.check_port_orientations(),
+                "min_feature_size": min_feature_size,
+                "port_count": port_count,
+                "port_widths": port_widths,
+                "port_orientations": port_orientations,
             },
             "violations": self.violations,
             "passed": len(self.violations) == 0
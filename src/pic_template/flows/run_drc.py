@@ -1,79 +1,206 @@
 from pathlib import Path
+import re
 import subprocess
 import os
 import sys
+import threading
+import xml.etree.ElementTree as ET
 from pic_template.config import get_config
 
-# Load configuration
-config = get_config()
-drc_config = config["drc"]
-gds_config = config["gds"]
-build_config = config["build"]
-
-# Construct GDS path from build and gds config
-gds_dir = build_config["gds_dir"]
-gds_filename = gds_config["filename"]
-GDS = (Path(gds_dir) / gds_filename).resolve()
-RULES = Path(drc_config["rules"]).resolve()
-REPORT = Path(drc_config["report"]).resolve()
-LOG = Path(drc_config["log"]).resolve()
-SUMMARY = Path(drc_config["summary_script"]).resolve()
-
-FAIL_ON_VIOLATIONS = drc_config.get("fail_on_violations", False)
+def parallel_args(drc_config: dict) -> list[str]:
+    """Build the KLayout ``-rd`` arguments that enable tiled multi-threaded DRC.
+
+    ``drc.threads`` of 1 (or unset) disables tiling; 0 uses every CPU core.
+    ``drc.tile_size`` (µm) overrides the deck's default of ~10% of the chip extent.
+    """
+    threads = drc_config.get("threads", 1)
+    if threads == 0:
+        threads = os.cpu_count() or 1
+    args = ["-rd", f"threads={threads}"]
+    tile_size = drc_config.get("tile_size")
+    if tile_size:
+        args += ["-rd", f"tile_size={tile_size}"]
+    return args
+
+
+# One component of a KLayout category path: 'quoted.name' or bare_name
+_CATEGORY_PART = re.compile(r"'((?:[^'\\]|\\.)*)'|([^.]+)")
+# Category names KLayout leaves unquoted in a path
+_CATEGORY_WORD = re.compile(r"[A-Za-z_$][A-Za-z0-9_$]*\Z")
+
+
+def _quote_category(name: str) -> str:
+    """Quote a category name the way KLayout's ``RdbCategory#path`` does."""
+    if _CATEGORY_WORD.match(name):
+        return name
+    return "'" + name.replace("\\", "\\\\").replace("'", "\\'") + "'"
+
+
+def _category_path(text: str) -> str:
+    """Normalize an item's category reference to KLayout's path form (e.g. "'WG.1'")."""
+    return ".".join(
+        _quote_category(re.sub(r"\\(.)", r"\1", quoted) if quoted else bare)
+        for quoted, bare in _CATEGORY_PART.findall(text.strip())
+    )
+
+
+def _leaf_categories(categories: ET.Element | None, prefix: str = "") -> list[str]:
+    """List the paths of all leaf rule categories declared in a report."""
+    leaves = []
+    for category in categories if categories is not None else ():
+        path = prefix + _quote_category(category.findtext("name") or "")
+        children = _leaf_categories(category.find("categories"), path + ".")
+        leaves.extend(children or [path])
+    return leaves
+
+
+def has_violations(report: Path) -> bool:
+    """Return True as soon as the first violation item is seen in a report.
+
+    Stops parsing at the first ``<item>``, so clean reports are decided
+    without building the whole XML tree.
+    """
+    for _, elem in ET.iterparse(report, events=("start",)):
+        if elem.tag == "item":
+            return True
+    return False
+
+
+def report_counts(report: Path) -> dict[str, int]:
+    """Count violations per rule in a KLayout report database (.lyrdb).
+
+    Parameters
+    ----------
+    report : Path
+        Report written by the DRC deck
+
+    Returns
+    -------
+    dict[str, int]
+        Violation count for every leaf rule category (zero if clean), keyed
+        by its KLayout category path, e.g. ``'WG.1'`` or ``grp.'M1.3'``
+    """
+    root = ET.parse(report).getroot()
+    counts = dict.fromkeys(_leaf_categories(root.find("categories")), 0)
+    for item in root.iterfind("items/item"):
+        path = _category_path(item.findtext("category") or "")
+        counts[path] = counts.get(path, 0) + 1
+    return counts
+
+
+def print_summary(counts: dict[str, int], top: int = 20) -> int:
+    """Print the DRC summary (same format as klayout/print_drc_report.rb).
+
+    Returns
+    -------
+    int
+        Total number of violations
+    """
+    total = sum(counts.values())
+    print(f"DRC SUMMARY: {total} total violations")
+    for name, n in sorted(counts.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"{n:6d}  {name}")
+    return total
+
+
+def _pump(stream, sink, lines: list[str]) -> None:
+    """Echo a subprocess pipe line by line as it arrives, keeping a copy."""
+    for line in iter(stream.readline, ""):
+        lines.append(line)
+        print(line, end="", file=sink, flush=True)
+
+
+def run_streaming(cmd: list[str], check: bool = False) -> subprocess.CompletedProcess:
+    """Run a command, echoing stdout/stderr live instead of buffering until exit.
+    
+    Both pipes are drained concurrently by reader threads so a chatty
+    process never blocks on a full pipe. The output is also returned, as
+    with ``subprocess.run``.
+    
+    Raises
+    ------
+    subprocess.CalledProcessError
+        If ``check`` is True and the command exits non-zero
+    """
+    out: list[str] = []
+    err: list[str] = []
+    with subprocess.Popen(
+        cmd, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=True, errors="replace"
+    ) as proc:
+        readers = [
+            threading.Thread(target=_pump, args=(proc.stdout, sys.stdout, out), daemon=True),
+            threading.Thread(target=_pump, args=(proc.stderr, sys.stderr, err), daemon=True),
+        ]
+        for reader in readers:
+            reader.start()
+        try:
+            for reader in readers:
+                reader.join()
+            returncode = proc.wait()
+        except BaseException:
+            # e.g. Ctrl-C: don't leave KLayout running behind us
+            proc.kill()
+            raise
+    
+    res = subprocess.CompletedProcess(cmd, returncode, "".join(out), "".join(err))
+    if check:
+        res.check_returncode()
+    return res
 
 
 def run():
-    if not GDS.exists():
-        raise FileNotFoundError(f"GDS not found: {GDS}")
-    if not RULES.exists():
-        raise FileNotFoundError(f"DRC rules not found: {RULES}")
-
-    REPORT.parent.mkdir(parents=True, exist_ok=True)
+    # Paths are resolved here rather than at import so that importing this
+    # module stays free of config and filesystem work
+    config = get_config()
+    drc_config = config["drc"]
+    gds_path = (Path(config["build"]["gds_dir"]) / config["gds"]["filename"]).absolute()
+    rules_path = Path(drc_config["rules"]).absolute()
+    report_path = Path(drc_config["report"]).absolute()
+    log_path = Path(drc_config["log"]).absolute()
+
+    if not os.access(gds_path, os.R_OK):
+        raise FileNotFoundError(f"GDS not found: {gds_path}")
+    if not os.access(rules_path, os.R_OK):
+        raise FileNotFoundError(f"DRC rules not found: {rules_path}")
+
+    report_path.parent.mkdir(parents=True, exist_ok=True)
 
     cmd = [
         "klayout",
         "-b",
-        "-r", str(RULES),
-        "-rd", f"input={GDS}",
-        "-rd", f"report={REPORT}",
-        "-rd", f"log={LOG}",
+        "-r", str(rules_path),
+        "-rd", f"input={gds_path}",
+        "-rd", f"report={report_path}",
+        "-rd", f"log={log_path}",
+        *parallel_args(drc_config),
     ]
 
     try:
-        res = subprocess.run(cmd, check=True, capture_output=True, text=True)
-        if res.stdout:
-            print(res.stdout, end="")
-        if res.stderr:
-            print(res.stderr, end="", file=sys.stderr)
-    except subprocess.CalledProcessError as e:
+        # Output is already echoed live, so only flag the failure here
+        run_streaming(cmd, check=True)
+    except subprocess.CalledProcessError:
         print("KLayout DRC failed")
-        print("STDOUT:\n" + (e.stdout or ""))
-        print("STDERR:\n" + (e.stderr or ""))
         raise
 
-    if not REPORT.exists():
-        raise RuntimeError(f"DRC report not created at {REPORT}")
+    print(f"✔ DRC finished. Report: {report_path}")
 
-    print(f"✔ DRC finished. Report: {REPORT}")
+    # Summarize in-process rather than paying a second KLayout startup;
+    # a clean report needs no per-rule tally. KLayout exited 0, so the
+    # report is trusted to exist rather than stat'ed up front.
+    try:
+        violations_found = has_violations(report_path)
+    except FileNotFoundError:
+        raise RuntimeError(f"DRC report not created at {report_path}") from None
 
-    if SUMMARY.exists():
-        print('Summary exists, running summary script...')
-        res = subprocess.run(
-            ["klayout", "-b", "-r", str(SUMMARY)],
-            check=False,
-            capture_output=True,
-            text=True,
-            env={**os.environ, "REPORT": str(REPORT)},
-        )
-        # Always show summary output
-        if res.stdout:
-            print(res.stdout.rstrip())
-        if res.stderr:
-            print(res.stderr.rstrip(), file=sys.stderr)
+    if violations_found:
+        total = print_summary(report_counts(report_path))
+    else:
+        total = 0
+        print("✔ DRC SUMMARY: 0 total violations")
 
-        if FAIL_ON_VIOLATIONS and res.returncode != 0:
-            # Let CI fail if summary script signals violations (e.g. exit 2)
-            sys.exit(res.returncode)
+    if drc_config.get("fail_on_violations", False) and total:
+        # Let CI fail on violations (same exit code as print_drc_report.rb)
+        sys.exit(2)
 
 
     OPEN = os.environ.get("OPEN", "") not in ("", "0", "false", "False")
@@ -81,7 +208,7 @@ def run():
 
     # after summary, if violations exist:
     if OPEN and not CI:
-        subprocess.Popen(["klayout", str(GDS), "-m", str(REPORT)])
+        subprocess.Popen(["klayout", str(gds_path), "-m", str(report_path)])
 
 
 
@@ -5,11 +5,13 @@ a unified verification report.
 """
 
 from __future__ import annotations
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import subprocess
 import sys
 from pic_template.config import get_config
 from pic_template.flows.geometry_check import GeometryChecker
+from pic_template.flows.run_drc import parallel_args
 from pic_template.chips.top import top
 
 
@@ -71,23 +73,27 @@ def run_enhanced_drc(use_enhanced_rules: bool = False) -> dict:
         "-rd", f"input={gds_path}",
         "-rd", f"report={report_path}",
         "-rd", f"log={log_path}",
+        *parallel_args(drc_config),
     ]
     
     try:
-        result = subprocess.run(cmd, check=True, capture_output=True, text=True)
+        # The deck already writes its log to log_path, so stdout is discarded
+        # rather than piped and decoded; stderr is kept to surface failures
+        subprocess.run(
+            cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True
+        )
         
         return {
             "success": True,
             "report_path": str(report_path),
             "rules_used": str(rules_path),
-            "stdout": result.stdout,
-            "stderr": result.stderr
+            "log_path": str(log_path)
         }
     except subprocess.CalledProcessError as e:
         return {
             "success": False,
             "error": f"DRC failed: {e}",
-            "stdout": e.stdout,
+            "log_path": str(log_path),
             "stderr": e.stderr
         }
     except FileNotFoundError:
@@ -136,62 +142,66 @@ def generate_verification_report(drc_results: dict, geometry_results: dict) -> s
     str
         Formatted report
     """
-    lines = []
-    lines.append("=" * 80)
-    lines.append("COMPREHENSIVE VERIFICATION REPORT")
-    lines.append("=" * 80)
-    lines.append("")
+    rule = "=" * 80
+    section = "─" * 80
     
     # DRC Results
-    lines.append("─" * 80)
-    lines.append("DRC (Design Rule Check) Results")
-    lines.append("─" * 80)
-    
     if drc_results["success"]:
-        lines.append("✓ DRC completed successfully")
-        lines.append(f"  Rules used: {drc_results.get('rules_used', 'N/A')}")
-        lines.append(f"  Report: {drc_results.get('report_path', 'N/A')}")
+        drc_block = (
+            "✓ DRC completed successfully\n"
+            f"  Rules used: {drc_results.get('rules_used', 'N/A')}\n"
+            f"  Report: {drc_results.get('report_path', 'N/A')}"
+        )
     else:
-        lines.append("✗ DRC failed")
-        lines.append(f"  Error: {drc_results.get('error', 'Unknown error')}")
-    
-    lines.append("")
+        drc_block = f"✗ DRC failed\n  Error: {drc_results.get('error', 'Unknown error')}"
     
     # Geometry Check Results
-    lines.append("─" * 80)
-    lines.append("Python Geometry Verification Results")
-    lines.append("─" * 80)
-    
     if geometry_results["success"]:
         results = geometry_results["results"]
-        lines.append(f"Component: {results['component_name']}")
-        lines.append("")
-        lines.append("Checks:")
-        
-        for check_name, passed in results["checks"].items():
-            status = "✓" if passed else "✗"
-            lines.append(f"  {status} {check_name}: {'PASS' if passed else 'FAIL'}")
-        
-        lines.append("")
-        
-        if results["violations"]:
-            lines.append(f"Violations found: {len(results['violations'])}")
-            for violation in results["violations"]:
-                lines.append(f"  - {violation}")
+        checks_block = "".join(
+            f"  {'✓' if passed else '✗'} {check_name}: {'PASS' if passed else 'FAIL'}\n"
+            for check_name, passed in results["checks"].items()
+        )
+        violations = results["violations"]
+        if violations:
+            violations_block = f"Violations found: {len(violations)}\n" + "\n".join(
+                f"  - {violation}" for violation in violations
+            )
         else:
-            lines.append("✓ No geometry violations found")
-        
-        lines.append("")
-        overall = "PASS" if results["passed"] else "FAIL"
-        lines.append(f"Overall: {overall}")
+            violations_block = "✓ No geometry violations found"
+        geometry_block = (
+            f"Component: {results['component_name']}\n"
+            "\n"
+            "Checks:\n"
+            f"{checks_block}"
+            "\n"
+            f"{violations_block}\n"
+            "\n"
+            f"Overall: {'PASS' if results['passed'] else 'FAIL'}"
+        )
     else:
-        lines.append("✗ Geometry checks failed")
-        lines.append(f"  Error: {geometry_results.get('error', 'Unknown error')}")
-    
-    lines.append("")
-    lines.append("=" * 80)
-    
-    return "\n".join(lines)
+        geometry_block = (
+            "✗ Geometry checks failed\n"
+            f"  Error: {geometry_results.get('error', 'Unknown error')}"
+        )
+    
+    return (
+        f"{rule}\n"
+        "COMPREHENSIVE VERIFICATION REPORT\n"
+        f"{rule}\n"
+        "\n"
+        f"{section}\n"
+        "DRC (Design Rule Check) Results\n"
+        f"{section}\n"
+        f"{drc_block}\n"
+        "\n"
+        f"{section}\n"
+        "Python Geometry Verification Results\n"
+        f"{section}\n"
+        f"{geometry_block}\n"
+        "\n"
+        f"{rule}"
+    )
 
 
 def main(use_enhanced_drc: bool = False):
@@ -205,13 +215,14 @@ def main(use_enhanced_drc: bool = False):
     print("Running comprehensive verification...")
     print("")
     
-    # Run DRC
-    print("1. Running DRC...")
-    drc_results = run_enhanced_drc(use_enhanced_rules=use_enhanced_drc)
-    
-    # Run geometry checks
-    print("2. Running geometry checks...")
-    geometry_results = run_geometry_checks()
+    # DRC is an external KLayout process and the geometry checks are pure
+    # Python on the top cell; they share no state, so run them side by side
+    print("Running DRC and geometry checks...")
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        drc_future = executor.submit(run_enhanced_drc, use_enhanced_drc)
+        geometry_future = executor.submit(run_geometry_checks)
+        drc_results = drc_future.result()
+        geometry_results = geometry_future.result()
     
     # Generate report
     print("")
@@ -1,7 +1,10 @@
 from __future__ import annotations
+from functools import lru_cache
 import gdsfactory as gf
 from .layers import LAYER
 
+# Cross-sections are immutable, so instances are shared per set of arguments
+@lru_cache(maxsize=32)
 def xs_strip(wg_width: float = 0.5):
     """Strip waveguide cross-section (single-layer silicon core).
     
@@ -27,6 +30,7 @@ def xs_strip(wg_width: float = 0.5):
         radius=10,
     )
 
+@lru_cache(maxsize=32)
 def xs_rib(wg_width: float = 0.5, slab_width: float = 2.0):
     """Rib waveguide cross-section (silicon core with slab underneath).
     
@@ -77,4 +77,10 @@ class LAYER(LayerMap):
 
     # Simulation/measurement layers
     SOURCE: Layer = (110, 0)
-    MONITOR: Layer = (101, 0)
\ No newline at end of file
+    MONITOR: Layer = (101, 0)
+
+
+# Flat (name, (layer, datatype)) pairs, materialized once for introspection
+LAYER_ITEMS: tuple[tuple[str, Layer], ...] = tuple(
+    (name, tuple(member)) for name, member in LAYER.__members__.items()
+)
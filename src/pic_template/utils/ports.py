@@ -0,0 +1,27 @@
+"""Port naming helpers shared by circuits."""
+
+from __future__ import annotations
+import functools
+import sys
+
+
+@functools.lru_cache(maxsize=256)
+def port_name(template: str, index: int) -> str:
+    """Return an interned port name for a channel index.
+    
+    Circuits that scale with channel count format the same names for every
+    build; caching them avoids re-formatting strings on each call.
+    
+    Parameters
+    ----------
+    template : str
+        Format string with one positional field, e.g. "ch{}_in"
+    index : int
+        Channel index
+    
+    Returns
+    -------
+    str
+        Formatted port name, e.g. "ch0_in"
+    """
+    return sys.intern(template.format(index))
@@ -126,3 +126,24 @@ def test_config_drc_paths_have_correct_extensions():
     
     assert drc["rules"].endswith(".drc"), "DRC rules should be .drc file"
     assert drc["report"].endswith(".lyrdb"), "DRC report should be .lyrdb file"
+
+
+def test_config_is_cached():
+    """Test that get_config() parses once and can be invalidated."""
+    from pic_template.config import invalidate_config_cache
+    
+    assert get_config() is get_config()
+    
+    first = get_config()
+    invalidate_config_cache()
+    assert get_config() is not first
+    assert get_config() == first
+
+
+def test_config_drc_threads_is_int():
+    """Test that the DRC thread count is a non-negative integer."""
+    drc = get_config()["drc"]
+    
+    assert "threads" in drc, "drc.threads missing from config"
+    assert isinstance(drc["threads"], int)
+    assert drc["threads"] >= 0
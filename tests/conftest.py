@@ -0,0 +1,76 @@
+"""Shared pytest fixtures.
+
+Component construction is the slow part of most tests, so commonly used
+components are built once and shared. Tests must treat them as read-only.
+"""
+
+import os
+import pytest
+from pic_template.config import get_config
+from pic_template.flows.geometry_check import GeometryChecker
+from pic_template.components.rings import ring_racetrack
+from pic_template.components.straight import straight_waveguide
+from pic_template.circuits.wdm_filter import wdm_filter
+from pic_template.circuits.waveguide_array import waveguide_array
+
+
+@pytest.fixture
+def component(request):
+    """Component built by the factory given as an indirect parameter.
+
+    Factories are @gf.cell functions, so every parameter row that names the
+    same factory already shares one instance.
+    """
+    return request.param()
+
+
+@pytest.fixture(scope="session")
+def pic_config():
+    """Project configuration (config.yaml)."""
+    return get_config()
+
+
+@pytest.fixture(scope="session")
+def klayout_files():
+    """Names of the files in klayout/, listed with a single directory read."""
+    with os.scandir("klayout") as entries:
+        return frozenset(entry.name for entry in entries if entry.is_file())
+
+
+@pytest.fixture(scope="session")
+def wg_default():
+    """Default straight waveguide."""
+    return straight_waveguide()
+
+
+@pytest.fixture(scope="session")
+def wg_straight():
+    """100 µm straight waveguide."""
+    return straight_waveguide(length=100)
+
+
+@pytest.fixture
+def checker(wg_default):
+    """Fresh GeometryChecker on the shared default waveguide.
+
+    Checkers accumulate violations, so only the component is shared.
+    """
+    return GeometryChecker(wg_default)
+
+
+@pytest.fixture(scope="module")
+def ring():
+    """Default ring racetrack."""
+    return ring_racetrack()
+
+
+@pytest.fixture(scope="module")
+def wdm_2ch():
+    """Two-channel WDM filter."""
+    return wdm_filter(n_channels=2)
+
+
+@pytest.fixture(scope="module")
+def array_3ch():
+    """Three-channel waveguide array."""
+    return waveguide_array(n_channels=3)
@@ -0,0 +1,16 @@
+import importlib
+
+# Flow modules and the entry points they must expose
+FLOW_MODULES = {
+    "pic_template.flows.geometry_check": ("GeometryChecker", "verify_component"),
+    "pic_template.flows.run_drc": ("run",),
+    "pic_template.flows.verify": ("main", "run_enhanced_drc", "run_geometry_checks"),
+}
+
+
+def test_all_modules_importable():
+    """Test that every flow module imports and exposes its entry points."""
+    for name, attrs in FLOW_MODULES.items():
+        module = importlib.import_module(name)
+        missing = [attr for attr in attrs if not hasattr(module, attr)]
+        assert not missing, f"{name} is missing {missing}"
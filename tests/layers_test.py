@@ -1,29 +1,25 @@
 # tests/layers_test.py
-from pic_template.pdk.layers import LAYER
+from pic_template.pdk.layers import LAYER, LAYER_ITEMS
+
+
+def test_layer_items_match_layer_map():
+    for name, value in LAYER_ITEMS:
+        member = getattr(LAYER, name)
+        assert value == (member.layer, member.datatype), name
+
 
 def test_layers_are_valid_gds_layers():
-    for name in dir(LAYER):
-        if name.startswith('_'):
-            continue
-        value = getattr(LAYER, name)
-        if not isinstance(value, tuple):
-            continue
-        assert isinstance(value, tuple), f"{name} does not resolve to (layer, datatype)"
-        assert len(value) == 2
+    assert LAYER_ITEMS, "LAYER defines no layers"
+    for name, value in LAYER_ITEMS:
+        assert len(value) == 2, f"{name} does not resolve to (layer, datatype)"
         assert all(isinstance(v, int) for v in value)
 
 
 def test_no_duplicate_layers():
-    seen = {}
-
-    for name in dir(LAYER):
-        if name.startswith('_'):
-            continue
-        value = getattr(LAYER, name)
-        if not isinstance(value, tuple):
-            continue
-        if value in seen:
-            raise AssertionError(
-                f"Duplicate layer {value}: {name} and {seen[value]}"
-            )
-        seen[value] = name
+    seen = {value: name for name, value in LAYER_ITEMS}
+    if len(seen) != len(LAYER_ITEMS):
+        duplicates = [
+            f"{value}: {name} and {seen[value]}"
+            for name, value in LAYER_ITEMS if seen[value] != name
+        ]
+        raise AssertionError(f"Duplicate layers {duplicates}")
@@ -56,7 +56,7 @@ def test_ring_with_different_coupling_gaps(gap):
     assert len(ring.ports) >= 2
 
 
-@pytest.mark.parametrize("n_channels", [2, 4, 8, 16])
+@pytest.mark.parametrize("n_channels", [1, 2, 4, 8, 16])
 def test_wdm_filter_with_different_channel_counts(n_channels):
     """Test WDM filter scales correctly with channel count."""
     wdm = wdm_filter(n_channels=n_channels)
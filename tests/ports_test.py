@@ -1,14 +1,12 @@
 """Tests for component and circuit port validation."""
 
-from pic_template.components.rings import ring_racetrack
-from pic_template.components.straight import straight_waveguide
 from pic_template.circuits.wdm_filter import wdm_filter
 from pic_template.circuits.waveguide_array import waveguide_array
 
 
-def test_straight_waveguide_has_required_ports():
+def test_straight_waveguide_has_required_ports(wg_default):
     """Test that straight waveguide has both input and output ports."""
-    wg = straight_waveguide()
+    wg = wg_default
     
     # Should have exactly 2 ports
     assert len(wg.ports) == 2, "Straight waveguide should have 2 ports"
@@ -19,10 +17,8 @@ def test_straight_waveguide_has_required_ports():
     assert "o2" in port_names, "Should have o2 port"
 
 
-def test_ring_racetrack_has_required_ports():
+def test_ring_racetrack_has_required_ports(ring):
     """Test that ring racetrack has bus ports."""
-    ring = ring_racetrack()
-    
     # Should have at least bus ports
     assert len(ring.ports) >= 2, "Ring should have at least 2 ports"
     
@@ -66,12 +62,9 @@ def test_waveguide_array_has_indexed_ports():
         assert f"out_{i}" in port_names, f"Should have out_{i} port"
 
 
-def test_all_ports_have_valid_orientations():
+def test_all_ports_have_valid_orientations(wg_default, ring):
     """Test that all component ports have valid orientations."""
-    components = [
-        straight_waveguide(),
-        ring_racetrack(),
-    ]
+    components = [wg_default, ring]
     
     valid_orientations = [0, 90, 180, 270]
     
@@ -81,9 +74,9 @@ def test_all_ports_have_valid_orientations():
                 f"Port {port.name} has invalid orientation {port.orientation}"
 
 
-def test_straight_waveguide_ports_are_opposite():
+def test_straight_waveguide_ports_are_opposite(wg_default):
     """Test that straight waveguide ports face opposite directions."""
-    wg = straight_waveguide()
+    wg = wg_default
     
     o1 = wg.ports["o1"]
     o2 = wg.ports["o2"]
@@ -94,14 +87,9 @@ def test_straight_waveguide_ports_are_opposite():
         "Straight waveguide ports should face opposite directions"
 
 
-def test_components_return_valid_objects():
+def test_components_return_valid_objects(wg_default, ring, wdm_2ch, array_3ch):
     """Test that all components return valid Component objects."""
-    components = [
-        straight_waveguide(),
-        ring_racetrack(),
-        wdm_filter(n_channels=2),
-        waveguide_array(n_channels=3),
-    ]
+    components = [wg_default, ring, wdm_2ch, array_3ch]
     
     for component in components:
         assert component is not None
@@ -109,12 +97,9 @@ def test_components_return_valid_objects():
         assert hasattr(component, 'name'), "Component should have name attribute"
 
 
-def test_port_widths_are_positive():
+def test_port_widths_are_positive(wg_default, ring):
     """Test that all ports have positive widths."""
-    components = [
-        straight_waveguide(),
-        ring_racetrack(),
-    ]
+    components = [wg_default, ring]
     
     for component in components:
         for port in component.ports:
@@ -2,27 +2,35 @@
 
 import pytest
 from pathlib import Path
+import gdsfactory as gf
 from pic_template.components.straight import straight_waveguide
 from pic_template.components.rings import ring_racetrack
-from pic_template.circuits.wdm_filter import wdm_filter
 from pic_template.flows.geometry_check import GeometryChecker, verify_component
-from pic_template.config import get_config
+from pic_template.pdk.layers import LAYER
 
 
-def test_geometry_checker_on_straight_waveguide():
+def _stub_component() -> gf.Component:
+    """100 µm x 0.5 µm rectangle with two ports, built without any factory."""
+    c = gf.Component()
+    c.add_polygon([(0, -0.25), (100, -0.25), (100, 0.25), (0, 0.25)], layer=LAYER.WG)
+    c.add_port("o1", center=(0, 0), width=0.5, orientation=180, layer=LAYER.WG)
+    c.add_port("o2", center=(100, 0), width=0.5, orientation=0, layer=LAYER.WG)
+    return c
+
+
+def test_geometry_checker_on_straight_waveguide(wg_straight):
     """Test geometry checker with straight waveguide."""
-    wg = straight_waveguide(length=100)
-    checker = GeometryChecker(wg)
+    # One run checks port widths and orientations in a single pass
+    results = verify_component(wg_straight)
     
-    # Run individual checks
-    assert checker.check_port_count(expected_count=2)
-    assert checker.check_port_widths()
-    assert checker.check_port_orientations()
+    assert len(wg_straight.ports) == 2
+    assert results["checks"]["port_count"]
+    assert results["checks"]["port_widths"]
+    assert results["checks"]["port_orientations"]
 
 
 def test_geometry_checker_detects_no_ports():
     """Test that checker detects missing ports."""
-    import gdsfactory as gf
     empty = gf.Component("empty")
     checker = GeometryChecker(empty)
     
@@ -31,10 +39,9 @@ def test_geometry_checker_detects_no_ports():
     assert len(checker.violations) > 0
 
 
-def test_geometry_checker_run_all():
+def test_geometry_checker_run_all(wg_default):
     """Test running all checks at once."""
-    wg = straight_waveguide()
-    results = verify_component(wg)
+    results = verify_component(wg_default)
     
     assert "component_name" in results
     assert "checks" in results
@@ -45,47 +52,42 @@ def test_geometry_checker_run_all():
     assert results["passed"]
 
 
-def test_geometry_checker_on_ring():
-    """Test geometry checker with ring racetrack."""
-    ring = ring_racetrack()
-    results = verify_component(ring)
-    
-    # Ring should have valid geometry
-    assert results["checks"]["port_count"]
-    assert results["checks"]["port_widths"]
-    assert results["checks"]["port_orientations"]
+_PORT_CHECKS = {"port_count": True, "port_widths": True, "port_orientations": True}
 
 
-def test_geometry_checker_on_circuit():
-    """Test geometry checker with WDM filter circuit."""
-    wdm = wdm_filter(n_channels=2)
-    results = verify_component(wdm)
+@pytest.mark.parametrize("fixture_name,expected", [
+    ("wg_default", _PORT_CHECKS),
+    ("ring", _PORT_CHECKS),
+    ("wdm_2ch", {"port_count": True}),
+], ids=["straight", "ring", "wdm_2ch"])
+def test_verify_component(request, fixture_name, expected):
+    """Test verification result format and expected checks per component."""
+    results = verify_component(request.getfixturevalue(fixture_name))
     
-    # WDM should have correct number of ports
-    assert results["checks"]["port_count"]
-
-
-def test_drc_rules_file_exists():
-    """Test that DRC rules files exist."""
-    simple_drc = Path("klayout/drc_simple_test.drc")
-    enhanced_drc = Path("klayout/drc_enhanced.drc")
+    # Check structure
+    assert isinstance(results, dict)
+    assert isinstance(results["checks"], dict)
+    assert isinstance(results["violations"], list)
+    assert isinstance(results["passed"], bool)
+    assert isinstance(results["component_name"], str)
+    
+    # Each check should be a boolean
+    for check_name, check_result in results["checks"].items():
+        assert isinstance(check_result, bool), f"{check_name} should be bool"
     
-    assert simple_drc.exists(), "Simple DRC file not found"
-    assert enhanced_drc.exists(), "Enhanced DRC file not found"
+    for check_name, check_result in expected.items():
+        assert results["checks"][check_name] is check_result, check_name
 
 
-def test_drc_script_can_run():
-    """Test that DRC flow script can be imported without errors."""
-    from pic_template.flows import run_drc
-    
-    # Should be able to import
-    assert hasattr(run_drc, 'run')
+def test_drc_rules_file_exists(klayout_files):
+    """Test that DRC rules files exist."""
+    assert "drc_simple_test.drc" in klayout_files, "Simple DRC file not found"
+    assert "drc_enhanced.drc" in klayout_files, "Enhanced DRC file not found"
 
 
-def test_drc_config_valid():
+def test_drc_config_valid(pic_config, klayout_files):
     """Test that DRC configuration is valid."""
-    config = get_config()
-    drc_config = config["drc"]
+    drc_config = pic_config["drc"]
     
     # Check required fields
     assert "rules" in drc_config
@@ -93,59 +95,125 @@ def test_drc_config_valid():
     
     # Check that rules file exists
     rules_path = Path(drc_config["rules"])
-    assert rules_path.exists(), f"DRC rules file {rules_path} not found"
+    if rules_path.parent == Path("klayout"):
+        found = rules_path.name in klayout_files
+    else:
+        found = rules_path.exists()
+    assert found, f"DRC rules file {rules_path} not found"
 
 
-def test_port_width_validation():
+def test_port_width_validation(checker):
     """Test that port width checker works correctly."""
-    wg = straight_waveguide()
-    checker = GeometryChecker(wg)
-    
     # Should pass with default waveguide
     assert checker.check_port_widths(min_width=0.3, max_width=2.0)
     
     # Should fail if we set impossible constraints
-    assert not checker.check_port_widths(min_width=10.0)
-    assert len(checker.violations) > 0
+    stub_checker = GeometryChecker(_stub_component())
+    assert not stub_checker.check_port_widths(min_width=10.0)
+    assert len(stub_checker.violations) > 0
 
 
-def test_bounding_box_constraints():
+def test_bounding_box_constraints(wg_straight):
     """Test bounding box constraint checking."""
-    wg = straight_waveguide(length=100)
-    checker = GeometryChecker(wg)
+    checker = GeometryChecker(wg_straight)
     
     # Should pass with reasonable limits
     assert checker.check_bounding_box(max_width=200, max_height=200)
     
     # Should fail with tight limits
-    checker2 = GeometryChecker(wg)
-    assert not checker2.check_bounding_box(max_width=10, max_height=10)
+    stub_checker = GeometryChecker(_stub_component())
+    assert not stub_checker.check_bounding_box(max_width=10, max_height=10)
 
 
-@pytest.mark.parametrize("component_func,expected_ports", [
+def test_replacing_component_warns(checker):
+    """Test that swapping the checked component warns and re-snapshots."""
+    stub = _stub_component()
+    
+    with pytest.warns(UserWarning):
+        checker.component = stub
+    
+    assert checker.component is stub
+    assert not checker.check_bounding_box(max_width=10)
+
+
+@pytest.mark.parametrize("component,expected_ports", [
     (straight_waveguide, 2),
     (ring_racetrack, 2),  # Has bus_o1 and bus_o2
-])
-def test_component_port_counts(component_func, expected_ports):
+], indirect=["component"], ids=["straight", "ring"])
+def test_component_port_counts(component, expected_ports):
     """Test that components have expected port counts."""
-    comp = component_func()
-    
     # Allow >= expected_ports since some components may have additional ports
-    assert len(comp.ports) >= expected_ports
-
-
-def test_verification_summary_format():
-    """Test that verification results have expected format."""
-    wg = straight_waveguide()
-    results = verify_component(wg)
-    
-    # Check structure
-    assert isinstance(results, dict)
-    assert isinstance(results["checks"], dict)
-    assert isinstance(results["violations"], list)
-    assert isinstance(results["passed"], bool)
-    assert isinstance(results["component_name"], str)
-    
-    # Each check should be a boolean
-    for check_name, check_result in results["checks"].items():
-        assert isinstance(check_result, bool), f"{check_name} should be bool"
+    assert len(component.ports) >= expected_ports
+
+
+def test_check_ports_matches_individual_checks(ring):
+    """Test that the fused port check agrees with the separate checks."""
+    fused = GeometryChecker(ring)
+    separate = GeometryChecker(ring)
+    
+    assert fused.check_ports(min_width=10.0) == (
+        separate.check_port_widths(min_width=10.0),
+        separate.check_port_orientations(),
+    )
+    assert fused.violations == separate.violations
+
+
+def test_drc_report_counts(tmp_path):
+    """Test that DRC report parsing counts violations per rule."""
+    from pic_template.flows.run_drc import has_violations, report_counts, print_summary
+    
+    report = tmp_path / "report.lyrdb"
+    report.write_text(
+        "<?xml version='1.0' encoding='utf-8'?>"
+        "<report-database><categories>"
+        "<category><name>WG.1</name><categories/></category>"
+        "<category><name>WG.2</name><categories/></category>"
+        "<category><name>grp</name><categories>"
+        "<category><name>M1.3</name><categories/></category>"
+        "</categories></category>"
+        "</categories><items>"
+        "<item><category>'WG.1'</category><cell>top</cell></item>"
+        "<item><category>'WG.1'</category><cell>top</cell></item>"
+        "<item><category>grp.'M1.3'</category><cell>top</cell></item>"
+        "</items></report-database>"
+    )
+    
+    # Keys are KLayout category paths, as print_drc_report.rb prints them
+    counts = report_counts(report)
+    assert counts == {"'WG.1'": 2, "'WG.2'": 0, "grp.'M1.3'": 1}
+    assert print_summary(counts) == 3
+    assert has_violations(report)
+    
+    clean = tmp_path / "clean.lyrdb"
+    clean.write_text("<report-database><categories/><items/></report-database>")
+    assert not has_violations(clean)
+
+
+def test_run_streaming_collects_output():
+    """Test that streamed subprocess output is still returned to the caller."""
+    import subprocess
+    import sys
+    from pic_template.flows.run_drc import run_streaming
+    
+    code = "import sys; print('out'); print('err', file=sys.stderr); sys.exit(3)"
+    res = run_streaming([sys.executable, "-c", code])
+    assert (res.returncode, res.stdout, res.stderr) == (3, "out\n", "err\n")
+    
+    with pytest.raises(subprocess.CalledProcessError):
+        run_streaming([sys.executable, "-c", code], check=True)
+    
+    # Lines far beyond any pipe/reader buffer size still come through whole
+    res = run_streaming([sys.executable, "-c", "print('x' * 100000)"])
+    assert res.stdout == "x" * 100000 + "\n"
+
+
+def test_parallel_args_defaults_to_untiled():
+    """Test that DRC tiling stays off unless threads is set explicitly."""
+    import os
+    from pic_template.flows.run_drc import parallel_args
+    
+    assert parallel_args({}) == ["-rd", "threads=1"]
+    assert parallel_args({"threads": 0}) == ["-rd", f"threads={os.cpu_count() or 1}"]
+    assert parallel_args({"threads": 4, "tile_size": 100}) == [
+        "-rd", "threads=4", "-rd", "tile_size=100",
+    ]